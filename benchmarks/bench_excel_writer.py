@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Benchmark de escritura Excel: ruta en una pasada (write-only) vs ruta anterior (ExcelWriter + load_workbook).
+
+Uso:
+    python benchmarks/bench_excel_writer.py --tickers 20 100 --days 260
+"""
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from common import load_updater_module, synthetic_data_dict
+
+
+def run_writer(module, updater, data_dict, fast):
+    """Devuelve (segundos, pico de memoria en MB, tamaño en KB). El tiempo se mide sin tracemalloc."""
+    module.EXCEL_FAST_WRITER = fast
+    updater.output_file_path = Path(f"bench_{'fast' if fast else 'legacy'}.xlsx")
+    start = time.perf_counter()
+    ok = updater.write_full_data_to_excel(data_dict)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    ok = ok and updater.write_full_data_to_excel(data_dict)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if not ok:
+        raise RuntimeError(f"Fallo en la escritura ({'fast' if fast else 'legacy'})")
+    return elapsed, peak / 1024 / 1024, updater.output_file_path.stat().st_size / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tickers', type=int, nargs='+', default=[20, 100])
+    parser.add_argument('--days', type=int, default=260)
+    args = parser.parse_args()
+    module = load_updater_module()
+    print(f"{'tickers':>8} {'ruta':>8} {'seg':>8} {'pico MB':>9} {'KB':>9}")
+    for n_tickers in args.tickers:
+        data_dict, groups = synthetic_data_dict(module, n_tickers, n_days=args.days)
+        module.TICKER_GROUPS = groups
+        updater = module.FinancialDataUpdater.__new__(module.FinancialDataUpdater)
+        updater.metrics = module.Metrics(profile=False)
+        results = {}
+        for fast in (False, True):
+            results[fast] = run_writer(module, updater, data_dict, fast)
+            elapsed, peak_mb, size_kb = results[fast]
+            print(f"{n_tickers:>8} {'fast' if fast else 'legacy':>8} {elapsed:>8.2f} {peak_mb:>9.1f} {size_kb:>9.0f}")
+        print(f"{'':>8} {'speedup':>8} {results[False][0] / results[True][0]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
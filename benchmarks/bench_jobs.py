@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Benchmark de los jobs COMPLETO y RÁPIDO con un proveedor yfinance sintético (sin red).
+
+Cada tamaño se ejecuta en un directorio limpio: job completo en frío (sin historial ni caché),
+job completo en caliente (historial incremental y caché de fundamentales llena) y job rápido.
+Los tiempos por etapa salen de las métricas del propio actualizador (FinancialDataUpdater.metrics); las
+etapas que corren en los hilos de descarga (ticker, ticker_*) suman el tiempo de todos los hilos.
+Google Sheets usa un cliente gspread falso en memoria.
+
+Uso:
+    python benchmarks/bench_jobs.py --tickers 20 500 5000 --latency 0.05 --out bench_jobs.json
+"""
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from common import FakeGSpreadClient, SyntheticYFinance, load_updater_module, synthetic_tickers
+
+RUNS = (('full_cold', 'job_full_update'), ('full_warm', 'job_full_update'), ('live', 'job_frequent_update'))
+
+
+def stage_rows(metrics):
+    """Spans del último job agregando los spans por ticker en una sola fila 'ticker'."""
+    rows, per_ticker = [], {}
+    for span in metrics.to_dict()['spans']:
+        labels = dict(span['labels'])
+        if 'ticker' in labels:
+            labels.pop('ticker')
+            agg = per_ticker.setdefault(tuple(sorted(labels.items())), {'count': 0, 'seconds_total': 0.0, 'seconds_max': 0.0})
+            agg['count'] += span['count']
+            agg['seconds_total'] += span['seconds_total']
+            agg['seconds_max'] = max(agg['seconds_max'], span['seconds_max'])
+        else:
+            rows.append(span)
+    rows.extend({'name': 'ticker', 'labels': dict(labels), **agg} for labels, agg in per_ticker.items())
+    return sorted(rows, key=lambda row: row['seconds_total'], reverse=True)
+
+
+def run_size(module, n_tickers, args, root):
+    workdir = root / f"tickers_{n_tickers}"
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.chdir(workdir)
+    module.create_directories()
+    tickers = synthetic_tickers(n_tickers)
+    module.TICKER_GROUPS = {f"Grupo {g}": tickers[g::5] for g in range(min(5, n_tickers))}
+    module.yf = SyntheticYFinance(latency=args.latency)
+    metrics = module.Metrics(profile=args.profile, profile_dir=workdir / "profiles")
+    updater = module.FinancialDataUpdater(tickers, module.OUTPUT_DIR, 15, 6, max_workers=args.workers, rate_per_sec=0,
+                                          gsheets_client=FakeGSpreadClient(), metrics=metrics)
+    results = []
+    for run_name, method in RUNS:
+        metrics.reset()
+        start = time.perf_counter()
+        getattr(updater, method)()
+        elapsed = time.perf_counter() - start
+        gauges = {row['name']: row['value'] for row in metrics.to_dict()['gauges'] if not row['labels'] or 'job' in row['labels']}
+        results.append({'tickers': n_tickers, 'run': run_name, 'seconds': elapsed, 'success': bool(gauges.get('job_last_success')),
+                        'peak_memory_mb': gauges.get('peak_memory_mb'), 'stages': stage_rows(metrics)})
+    return results
+
+
+def print_results(results, top):
+    print(f"{'tickers':>8} {'run':>10} {'seg':>9} {'pico MB':>8}  etapas (seg totales)")
+    for result in results:
+        peak = f"{result['peak_memory_mb']:.0f}" if result['peak_memory_mb'] is not None else '-'
+        stages = [row for row in result['stages'] if row['name'] != 'job']
+        summary = ", ".join(f"{row['name']}{'[' + ','.join(map(str, row['labels'].values())) + ']' if row['labels'] else ''} {row['seconds_total']:.2f}" for row in stages[:top])
+        print(f"{result['tickers']:>8} {result['run']:>10} {result['seconds']:>9.2f} {peak:>8}  {summary}{'' if result['success'] else '  (FALLO)'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tickers', type=int, nargs='+', default=[20, 500, 5000])
+    parser.add_argument('--latency', type=float, default=0.0, help="Latencia simulada por petición a yfinance (seg)")
+    parser.add_argument('--workers', type=int, default=None, help="Hilos de descarga (por defecto FETCH_MAX_WORKERS)")
+    parser.add_argument('--profile', action='store_true', help="cProfile + tracemalloc (más lento; añade pico de memoria)")
+    parser.add_argument('--top', type=int, default=6, help="Etapas a mostrar por ejecución")
+    parser.add_argument('--out', type=Path, default=None, help="Guardar resultados completos en JSON")
+    args = parser.parse_args()
+    out = args.out.resolve() if args.out else None  # Antes de que load_updater_module cambie de directorio
+    module = load_updater_module()
+    args.workers = args.workers or module.FETCH_MAX_WORKERS
+    root = Path.cwd()
+    results = []
+    for n_tickers in args.tickers:
+        size_results = run_size(module, n_tickers, args, root)
+        print_results(size_results, args.top)
+        results.extend(size_results)
+    if out:
+        out.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"Resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
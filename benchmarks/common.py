@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""Utilidades compartidas por los benchmarks: carga de financial_updater.PY, datos sintéticos y proveedores falsos."""
+import importlib.machinery
+import importlib.util
+import logging
+import os
+import tempfile
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from gspread.utils import a1_range_to_grid_range
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+UPDATER_FILE = REPO_DIR / "financial_updater.PY"
+
+
+def load_updater_module(workdir=None):
+    """Importa financial_updater.PY (extensión en mayúsculas) ejecutándolo dentro de `workdir`.
+
+    El módulo crea Financial_Data/, Logs/ y Cache/ relativos al directorio actual, por eso se
+    cambia a un directorio temporal antes de cargarlo.
+    """
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="fu_bench_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.chdir(workdir)
+    loader = importlib.machinery.SourceFileLoader("financial_updater", str(UPDATER_FILE))
+    spec = importlib.util.spec_from_loader("financial_updater", loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    logging.getLogger().setLevel(logging.WARNING)
+    return module
+
+
+def synthetic_tickers(n_tickers):
+    return [f"SYN{i:04d}" for i in range(n_tickers)]
+
+
+def synthetic_prices(tickers, n_days, end=None, seed=42):
+    """Precios de cierre sintéticos (paseo aleatorio geométrico), DataFrame fecha x ticker."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=end or pd.Timestamp.today().normalize(), periods=n_days, name='Date')
+    returns = rng.normal(0.0003, 0.015, size=(n_days, len(tickers)))
+    start = rng.uniform(10, 500, size=len(tickers))
+    return pd.DataFrame(start * np.exp(np.cumsum(returns, axis=0)), index=index, columns=tickers)
+
+
+def synthetic_statement(seed, n_metrics=30, n_periods=4):
+    rng = np.random.default_rng(seed)
+    periods = pd.to_datetime([f"{2025 - i}-12-31" for i in range(n_periods)])
+    index = [f"Metric {i}" for i in range(n_metrics)]
+    return pd.DataFrame(rng.normal(1e9, 3e8, size=(n_metrics, n_periods)), index=index, columns=periods)
+
+
+def synthetic_data_dict(module, n_tickers, n_days=260, news_per_ticker=8):
+    """data_dict con la misma forma que fetch_full_financial_data, sin acceso a red."""
+    tickers = synthetic_tickers(n_tickers)
+    prices = synthetic_prices(tickers, n_days)
+    rng = np.random.default_rng(7)
+    summary = pd.DataFrame({
+        'Ticker': tickers,
+        'Nombre': [f"Synthetic {t}" for t in tickers],
+        'Precio Actual': prices.iloc[-1].to_numpy(),
+        'Cambio Hoy (%)': rng.normal(0, 2, n_tickers),
+        f'SMA {module.SMA_SHORT}': prices.tail(module.SMA_SHORT).mean().to_numpy(),
+        f'SMA {module.SMA_LONG}': prices.tail(module.SMA_LONG).mean().to_numpy(),
+        'RSI': rng.uniform(20, 80, n_tickers),
+    })
+    summary = summary.reindex(columns=['Ticker', 'Nombre', 'Precio Actual', 'Cambio Hoy (%)', f'SMA {module.SMA_SHORT}', f'SMA {module.SMA_LONG}', 'RSI', 'Máx Hoy', 'Mín Hoy', 'Volumen', 'Capitalización Mercado', 'PER', 'EPS Trail', 'EPS Fwd', 'P/B Ratio', 'Beta', 'Rend. Dividendo (%)', 'Tasa Dividendo', 'Fecha Ex-Dividendo', 'Máx 52 Sem', 'Mín 52 Sem', '% Rango 52 Sem', 'Target Precio Medio', 'Target Precio Alto', 'Target Precio Bajo', 'Recom. Media', 'Recom. Clave', 'Última Actualización Info'])
+    for col in summary.columns[7:]:
+        summary[col] = rng.uniform(1, 100, n_tickers)
+    summary = summary.astype(object).fillna('N/A')
+    financials = {}
+    for i, t in enumerate(tickers):
+        for j, kind in enumerate(('Financials', 'BalanceSheet', 'Cashflow')):
+            financials[f"{t}_{kind}"] = synthetic_statement(i * 3 + j)
+    news = pd.DataFrame([{'Ticker': t, 'Título': f"Noticia {k} sobre {t} " * 3, 'Publicador': 'Synthetic Wire', 'Enlace': f"https://example.com/{t}/{k}", 'Tipo': 'STORY', 'Fecha': '2026-01-01 10:00:00'}
+                         for t in tickers for k in range(news_per_ticker)])
+    groups = {f"Grupo {g}": tickers[g::5] for g in range(min(5, n_tickers))}
+    return {'summary': summary, 'history': {'Adj Close': prices}, 'financials': financials, 'news': news}, groups
+
+
+class SyntheticTicker:
+    """Sustituto de yf.Ticker con datos deterministas por símbolo y latencia opcional por petición.
+
+    Con `provider` (SyntheticYFinance) el quote de `.info` sale de la última barra de su serie, igual que en Yahoo.
+    """
+
+    def __init__(self, symbol, latency=0.0, provider=None):
+        self.symbol = symbol
+        self.latency = latency
+        self.provider = provider
+        self._rng_seed = sum(ord(c) * (i + 1) for i, c in enumerate(symbol))
+
+    def _wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    @property
+    def info(self):
+        self._wait()
+        rng = np.random.default_rng(self._rng_seed)
+        price = float(rng.uniform(10, 500))
+        quote = {'currentPrice': price, 'previousClose': price / 1.01, 'regularMarketChangePercent': 1.0, 'dayHigh': price * 1.02,
+                 'dayLow': price * 0.98, 'regularMarketVolume': int(rng.integers(1e5, 1e7)), 'fiftyTwoWeekHigh': price * 1.3, 'fiftyTwoWeekLow': price * 0.7}
+        if self.provider is not None:
+            quote = self.provider.quote(self.symbol)
+            price = quote['currentPrice']
+        return {'quoteType': 'EQUITY', 'shortName': f"Synthetic {self.symbol}", **quote, 'regularMarketPrice': price,
+                'marketCap': int(price * 1e8), 'sharesOutstanding': 100_000_000, 'trailingPE': 20.0, 'trailingEps': price / 20, 'forwardEps': price / 18,
+                'priceToBook': 3.0, 'bookValue': price / 3, 'beta': 1.1, 'dividendYield': 0.015, 'dividendRate': 1.2, 'exDividendDate': 1760000000,
+                'targetMeanPrice': price * 1.1, 'targetHighPrice': price * 1.4, 'targetLowPrice': price * 0.8,
+                'recommendationMean': 2.1, 'recommendationKey': 'buy'}
+
+    def _statement(self, offset):
+        self._wait()
+        return synthetic_statement(self._rng_seed + offset)
+
+    financials = property(lambda self: self._statement(0))
+    balance_sheet = property(lambda self: self._statement(1))
+    cashflow = property(lambda self: self._statement(2))
+
+    @property
+    def news(self):
+        self._wait()
+        return [{'title': f"Noticia {k} sobre {self.symbol}", 'publisher': 'Synthetic Wire', 'link': f"https://example.com/{self.symbol}/{k}",
+                 'type': 'STORY', 'providerPublishTime': 1760000000 + k * 3600} for k in range(8)]
+
+
+class SyntheticYFinance:
+    """Sustituto offline del módulo yfinance (Tickers y download) para los benchmarks de los jobs.
+
+    Los precios de cada símbolo salen de una serie fija, así que descargas sucesivas son coherentes
+    (el historial incremental no detecta revisiones falsas).
+    """
+
+    def __init__(self, latency=0.0, end=None):
+        self.latency = latency
+        self.end = pd.Timestamp(end or pd.Timestamp.today().normalize())
+        self._calendar = pd.bdate_range(end=self.end, periods=400, name='Date')
+        self._prices = {}
+        self.download_calls = 0
+
+    def Tickers(self, symbols):
+        return types.SimpleNamespace(tickers={s: SyntheticTicker(s, self.latency, provider=self) for s in symbols})
+
+    def download(self, tickers, period=None, start=None, **kwargs):
+        self.download_calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        first = self._calendar.searchsorted(pd.Timestamp(start)) if start is not None else 0
+        return pd.concat({t: self._bars(t).iloc[first:] for t in tickers}, axis=1)
+
+    def quote(self, symbol):
+        """Campos de quote de `.info` coherentes con las barras: última sesión y rango de 52 semanas."""
+        bars = self._bars(symbol)
+        last, year = bars.iloc[-1], bars[bars.index > self.end - pd.Timedelta(days=365)]
+        return {'currentPrice': float(last['Close']), 'previousClose': float(bars['Close'].iloc[-2]),
+                'regularMarketChangePercent': float(last['Close'] / bars['Close'].iloc[-2] - 1) * 100,
+                'dayHigh': float(last['High']), 'dayLow': float(last['Low']), 'regularMarketVolume': int(last['Volume']),
+                'fiftyTwoWeekHigh': float(year['High'].max()), 'fiftyTwoWeekLow': float(year['Low'].min())}
+
+    def _bars(self, symbol):
+        """Barras OHLCV del símbolo (Adj Close = Close, sin dividendos)."""
+        close = self._series(symbol)
+        volume = (np.abs(np.sin(np.arange(len(close)) + len(symbol))) * 1e7).astype('int64') + 100_000
+        return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close, 'Adj Close': close, 'Volume': volume},
+                            index=self._calendar)
+
+    def _series(self, symbol):
+        """Serie de precios fija por símbolo sobre self._calendar (misma semilla -> mismos valores en cada descarga)."""
+        if symbol not in self._prices:
+            rng = np.random.default_rng(sum(ord(c) * (i + 1) for i, c in enumerate(symbol)))
+            self._prices[symbol] = rng.uniform(10, 500) * np.exp(np.cumsum(rng.normal(0.0003, 0.015, len(self._calendar))))
+        return self._prices[symbol]
+
+
+class FakeWorksheet:
+    """Hoja en memoria con la parte de la interfaz de gspread.Worksheet que usa GoogleSheetsSink."""
+
+    def __init__(self, rows=1000, cols=26):
+        self.row_count, self.col_count = rows, cols
+        self.cells = {}
+        self.batch_calls = 0
+
+    def get_all_values(self):
+        if not self.cells:
+            return []
+        n_rows = max(r for r, _ in self.cells) + 1
+        n_cols = max(c for _, c in self.cells) + 1
+        return [[self.cells.get((r, c), '') for c in range(n_cols)] for r in range(n_rows)]
+
+    def resize(self, rows=None, cols=None):
+        self.row_count, self.col_count = rows or self.row_count, cols or self.col_count
+
+    def batch_update(self, data, **kwargs):
+        self.batch_calls += 1
+        for item in data:
+            grid = a1_range_to_grid_range(item['range'])
+            for i, row in enumerate(item['values']):
+                for j, value in enumerate(row):
+                    self.cells[(grid['startRowIndex'] + i, grid['startColumnIndex'] + j)] = value
+
+
+class FakeGSpreadClient:
+    """Cliente gspread falso: open(libro).worksheet(hoja) devuelve siempre la misma FakeWorksheet."""
+
+    def __init__(self):
+        self.sheet = FakeWorksheet()
+
+    def open(self, name):
+        return self
+
+    def worksheet(self, name):
+        return self.sheet
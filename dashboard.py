@@ -5,6 +5,7 @@ import plotly.graph_objects as go # Para gráficos más complejos (ej. con indic
 import numpy as np
 from pathlib import Path
 import datetime
+import pyarrow.parquet as pq
 
 # --- Configuración de la Página ---
 st.set_page_config(layout="wide", page_title="Dashboard Financiero Dinámico")
@@ -13,84 +14,80 @@ st.set_page_config(layout="wide", page_title="Dashboard Financiero Dinámico")
 st.title("📊 Dashboard Financiero Dinámico")
 st.markdown("Visualización de datos financieros actualizados periódicamente.")
 
-# --- Cargar Datos desde Excel ---
-# Ruta al archivo Excel generado por financial_updater.py
-EXCEL_FILE = Path("./Financial_Data/Dynamic Financial Data.xlsx")
+# --- Cargar Datos desde el Modelo de Lectura ---
+# Parquet publicados por financial_updater.py (uno por dataset); evita parsear todo el Excel en cada carga
+READ_MODEL_DIR = Path("./Financial_Data/read_model")
+DATASETS = ("summary", "history", "live", "news")
 
-@st.cache_data(ttl=60) # Cachear datos por 60 segundos para balancear frescura y rendimiento
-def load_financial_data(file_path):
-    """Carga datos desde el archivo Excel generado, manejando hojas faltantes."""
-    all_data = {}
-    try:
-        # Leer TODAS las hojas existentes en el archivo
-        excel_sheets = pd.read_excel(file_path, sheet_name=None, engine='openpyxl') # sheet_name=None lee todas
-
-        # Asignar DataFrames si la hoja existe, si no, asignar uno vacío
-        all_data['summary'] = excel_sheets.get("Resumen General", pd.DataFrame())
-        all_data['history'] = excel_sheets.get("Historial_Adj_Close", pd.DataFrame())
-        all_data['live'] = excel_sheets.get("Live Data", pd.DataFrame()) # No fallará si no existe
-        all_data['news'] = excel_sheets.get("Noticias Recientes", pd.DataFrame())
-
-        # --- Procesamiento Post-Carga ---
-        # Convertir columna 'Fecha' en historial a datetime si no lo es
-        if not all_data['history'].empty and 'Fecha' in all_data['history'].columns:
-            all_data['history']['Fecha'] = pd.to_datetime(all_data['history']['Fecha'], errors='coerce')
-            # Establecer Fecha como índice para facilitar resampling y gráficos
-            # Comprobar si 'Fecha' no es ya el índice antes de establecerlo
-            if all_data['history'].index.name != 'Fecha':
-                all_data['history'].set_index('Fecha', inplace=True, drop=False) # drop=False para mantener la columna Fecha
-
-        # Convertir Timestamp en live a datetime
-        if not all_data['live'].empty and 'Timestamp Live' in all_data['live'].columns:
-             all_data['live']['Timestamp Live'] = pd.to_datetime(all_data['live']['Timestamp Live'], errors='coerce')
-
-        # Convertir Fecha en news a datetime
-        if not all_data['news'].empty and 'Fecha' in all_data['news'].columns:
-             all_data['news']['Fecha'] = pd.to_datetime(all_data['news']['Fecha'], errors='coerce')
-
-        return all_data
+def dataset_path(name):
+    return READ_MODEL_DIR / f"{name}.parquet"
 
+def dataset_version(name):
+    """mtime del Parquet (cambia con cada publicación); None si no existe. Se usa como clave de caché."""
+    try:
+        return dataset_path(name).stat().st_mtime_ns
     except FileNotFoundError:
-        st.error(f"❌ No se encontró el archivo Excel: '{file_path}'. Asegúrate de que `financial_updater.py` se haya ejecutado al menos una vez.")
-        return None
-    except Exception as e:
-        st.error(f"Error inesperado al cargar los datos desde Excel: {e}")
         return None
 
+@st.cache_data(max_entries=32) # Sin TTL: la clave incluye la versión, así que se invalida al publicarse datos nuevos
+def load_dataset(name, version, columns=None):
+    """Carga un dataset del modelo de lectura (opcionalmente sólo algunas columnas)."""
+    if version is None:
+        return pd.DataFrame()
+    df = pd.read_parquet(dataset_path(name), columns=list(columns) if columns else None)
+    # --- Procesamiento Post-Carga ---
+    if name == 'history' and 'Fecha' in df.columns:
+        df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
+        df.set_index('Fecha', inplace=True, drop=False) # drop=False para mantener la columna Fecha
+    elif name == 'live' and 'Timestamp Live' in df.columns:
+        df['Timestamp Live'] = pd.to_datetime(df['Timestamp Live'], errors='coerce')
+    elif name == 'news' and 'Fecha' in df.columns:
+        df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
+    return df
+
+@st.cache_data(max_entries=8)
+def load_history_tickers(version):
+    """Tickers disponibles en el historial, leídos del esquema Parquet sin cargar los datos."""
+    if version is None:
+        return []
+    return [c for c in pq.read_schema(dataset_path('history')).names if c != 'Fecha']
+
 # --- Cargar y Validar Datos ---
-financial_data = load_financial_data(EXCEL_FILE)
+versions = {name: dataset_version(name) for name in DATASETS}
 
-if financial_data is None:
+if versions['summary'] is None and versions['history'] is None:
+    st.error(f"❌ No se encontraron datos en '{READ_MODEL_DIR}'. Asegúrate de que `financial_updater.py` haya completado al menos un Job COMPLETO.")
     st.stop() # Detener si no se cargaron datos
 
-df_summary = financial_data['summary']
-df_history = financial_data['history']
-df_live = financial_data['live']
-df_news = financial_data['news']
+try:
+    df_summary = load_dataset('summary', versions['summary'])
+    df_live = load_dataset('live', versions['live'])
+    df_news = load_dataset('news', versions['news'])
+    available_tickers = load_history_tickers(versions['history'])
+except Exception as e:
+    st.error(f"Error inesperado al cargar los datos: {e}")
+    st.stop()
 
-if df_summary.empty or df_history.empty:
+if df_summary.empty or not available_tickers:
     st.warning("⚠️ Faltan datos esenciales (Resumen o Historial). El dashboard puede estar incompleto.")
     # Podríamos detenernos aquí o continuar mostrando lo que haya
     # st.stop()
 
-st.success(f"✔️ Datos cargados desde '{EXCEL_FILE.name}'.")
+st.success(f"✔️ Datos cargados desde '{READ_MODEL_DIR}'.")
 
 # --- Sidebar para Filtros y Opciones ---
 st.sidebar.header("Filtros y Opciones")
 
 # Selección de Tickers para gráficos
-# Usar tickers disponibles en el historial como opciones
-available_tickers = df_history.columns.tolist() if not df_history.empty else []
-# Excluir la columna 'Fecha' si todavía está presente después de set_index(drop=False)
-if 'Fecha' in available_tickers:
-    available_tickers.remove('Fecha')
-
 selected_tickers = st.sidebar.multiselect(
     "Selecciona Tickers para Gráfico Histórico:",
     options=available_tickers,
     default=available_tickers[:min(5, len(available_tickers))] # Mostrar los primeros 5 por defecto
 )
 
+# Solo se leen del Parquet las columnas de los tickers seleccionados
+df_history = load_dataset('history', versions['history'], tuple(['Fecha'] + selected_tickers)) if selected_tickers else pd.DataFrame()
+
 # --- Resumen de Métricas Clave ---
 st.header("🚀 Resumen General")
 
@@ -120,7 +117,7 @@ if not df_live.empty:
     last_live_update = df_live_sorted['Timestamp Live'].iloc[0].strftime('%Y-%m-%d %H:%M:%S') if not df_live_sorted.empty and pd.notna(df_live_sorted['Timestamp Live'].iloc[0]) else "N/A"
     st.caption(f"Última actualización de datos en vivo: {last_live_update}")
 else:
-    st.info("Hoja 'Live Data' no encontrada o vacía. Espera a la próxima ejecución de `job_frequent_update`.")
+    st.info(f"No hay datos en vivo en '{dataset_path('live')}'. Espera a la próxima ejecución de `job_frequent_update`.")
 
 # --- Visualizaciones ---
 st.header("📈 Gráficos de Rendimiento")
@@ -149,7 +146,7 @@ if not df_history.empty and selected_tickers:
             df_first_values = pd.Series([df_hist_selected.at[idx, col] if pd.notna(idx) else np.nan for col, idx in first_valid_idx.items()], index=df_hist_selected.columns)
 
             df_normalized = df_hist_selected.apply(lambda col: (col / df_first_values[col.name]) * 100 if col.name in df_first_values and pd.notna(df_first_values[col.name]) and df_first_values[col.name] != 0 else col, axis=0)
-            df_normalized.fillna(method='ffill', inplace=True)
+            df_normalized = df_normalized.ffill()
 
             # Resetear índice para que 'Fecha' sea una columna para Plotly
             df_plot = df_normalized.reset_index()
@@ -168,7 +165,7 @@ if not df_history.empty and selected_tickers:
         except Exception as e:
             st.error(f"Error al generar el gráfico normalizado: {e}")
 
-elif df_history.empty:
+elif not available_tickers:
      st.warning("No hay datos históricos disponibles para graficar.")
 else:
      st.info("Selecciona al menos un ticker en la barra lateral para ver el gráfico histórico.")
@@ -210,8 +207,8 @@ with st.expander("Ver Tabla Resumen General", expanded=False):
     else: st.info("No hay datos de resumen.")
 
 with st.expander("Ver Tabla Historial (Últimos 10 días)", expanded=False):
-     if not df_history.empty: st.dataframe(df_history.tail(10)) # Muestra el DF con su índice 'Fecha'
-     else: st.info("No hay datos históricos.")
+     if not df_history.empty: st.dataframe(df_history.tail(10)) # Muestra el DF con su índice 'Fecha' (tickers seleccionados)
+     else: st.info("No hay datos históricos para los tickers seleccionados.")
 
 with st.expander("Ver Noticias Recientes", expanded=False):
      if not df_news.empty: st.dataframe(df_news[['Ticker', 'Título', 'Publicador', 'Fecha', 'Enlace']])
@@ -221,7 +218,7 @@ with st.expander("Ver Noticias Recientes", expanded=False):
 st.sidebar.header("Acerca de")
 st.sidebar.info("Dashboard de datos financieros recopilados por `financial_updater.py`.")
 st.sidebar.header("Fuente de Datos")
-st.sidebar.markdown(f"Datos desde: `{EXCEL_FILE.name}`")
+st.sidebar.markdown(f"Datos desde: `{READ_MODEL_DIR}`")
 st.sidebar.markdown("---")
 if st.sidebar.button("Recargar Datos"):
     st.cache_data.clear(); st.rerun()
\ No newline at end of file